@@ -1,12 +1,21 @@
 # VKR.py
 # Сетевая информационная система по детским инфекционным заболеваниям
 
+import gzip
+import hashlib
 from enum import Enum
-from typing import List, Optional, Dict
+from functools import lru_cache
+from typing import List, Optional, Dict, Tuple
 
-from fastapi import FastAPI, HTTPException, Query
-from fastapi.responses import HTMLResponse
-from pydantic import BaseModel, Field
+import orjson
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import HTMLResponse, Response
+from pydantic import BaseModel, ConfigDict, Field
+
+try:
+    import brotli
+except ImportError:  # Brotli необязателен: без него страница отдаётся в gzip
+    brotli = None
 
 app = FastAPI(
     title="Информационная система по детским инфекционным заболеваниям",
@@ -40,24 +49,30 @@ class AgeGroup(str, Enum):
 
 class Symptom(BaseModel):
     """Симптом заболевания."""
+    model_config = ConfigDict(frozen=True)
+
     id: int
     name: str
     description: Optional[str] = None
 
 
 class Disease(BaseModel):
-    """Полное описание заболевания."""
+    """Полное описание заболевания (симптомы хранятся как ссылки на SYMPTOMS_DB)."""
+    model_config = ConfigDict(frozen=True)
+
     id: int
     name: str
     pathogen_type: str
     transmission: str
     age_group: AgeGroup
-    symptoms: List[Symptom]
+    symptom_ids: Tuple[int, ...]
     prevention: Optional[str] = None
 
 
 class DiseaseShort(BaseModel):
     """Короткое описание заболевания (для списков)."""
+    model_config = ConfigDict(frozen=True)
+
     id: int
     name: str
     age_group: AgeGroup
@@ -66,14 +81,25 @@ class DiseaseShort(BaseModel):
 
 class StatisticItem(BaseModel):
     """Статистический показатель."""
+    model_config = ConfigDict(frozen=True)
+
     disease_id: int
     year: int
     season: Season
     cases: int = Field(..., ge=0)
 
 
-class DiseaseWithStats(Disease):
-    """Данные по заболеванию с сезонной статистикой."""
+class DiseaseWithStats(BaseModel):
+    """Данные по заболеванию с симптомами и сезонной статистикой."""
+    model_config = ConfigDict(frozen=True)
+
+    id: int
+    name: str
+    pathogen_type: str
+    transmission: str
+    age_group: AgeGroup
+    symptoms: List[Symptom]
+    prevention: Optional[str] = None
     statistics: List[StatisticItem]
 
 
@@ -81,7 +107,7 @@ class DiseaseWithStats(Disease):
 # "БАЗА ДАННЫХ" В ПАМЯТИ
 # ---------------------------------------------------------------------------
 
-SYMPTOMS_DB: List[Symptom] = [
+SYMPTOMS_DB: Tuple[Symptom, ...] = (
     Symptom(id=1, name="Лихорадка", description="Повышенная температура тела"),
     Symptom(id=2, name="Сыпь", description="Пятнистая или папулёзная сыпь"),
     Symptom(id=3, name="Кашель", description="Сухой или влажный кашель"),
@@ -92,18 +118,18 @@ SYMPTOMS_DB: List[Symptom] = [
     Symptom(id=8, name="Боль в горле", description="Воспаление слизистой горла"),
     Symptom(id=9, name="Конъюнктивит", description="Покраснение и воспаление глаз"),
     Symptom(id=10, name="Увеличение лимфоузлов", description="Лимфаденопатия"),
-]
+)
 
 SYMPTOMS_BY_ID: Dict[int, Symptom] = {s.id: s for s in SYMPTOMS_DB}
 
-DISEASES_DB: List[Disease] = [
+DISEASES_DB: Tuple[Disease, ...] = (
     Disease(
         id=1,
         name="Корь",
         pathogen_type="Вирус",
         transmission="Воздушно-капельный",
         age_group=AgeGroup.preschool,
-        symptoms=[SYMPTOMS_BY_ID[1], SYMPTOMS_BY_ID[2], SYMPTOMS_BY_ID[10]],
+        symptom_ids=(1, 2, 10),
         prevention="Вакцинация по национальному календарю",
     ),
     Disease(
@@ -112,7 +138,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Бактерия",
         transmission="Воздушно-капельный",
         age_group=AgeGroup.under7,
-        symptoms=[SYMPTOMS_BY_ID[1], SYMPTOMS_BY_ID[3]],
+        symptom_ids=(1, 3),
         prevention="Вакцинация (АКДС)",
     ),
     Disease(
@@ -121,7 +147,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Вирус",
         transmission="Воздушно-капельный",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[2], SYMPTOMS_BY_ID[1]],
+        symptom_ids=(2, 1),
         prevention="Изоляция заболевших, вакцинация",
     ),
     Disease(
@@ -130,7 +156,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Вирус",
         transmission="Воздушно-капельный",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[2], SYMPTOMS_BY_ID[9]],
+        symptom_ids=(2, 9),
         prevention="Вакцинация (КПК)",
     ),
     Disease(
@@ -139,7 +165,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Бактерия",
         transmission="Контактно-бытовой",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[8], SYMPTOMS_BY_ID[2], SYMPTOMS_BY_ID[1]],
+        symptom_ids=(8, 2, 1),
         prevention="Своевременное назначение антибиотиков",
     ),
     Disease(
@@ -148,7 +174,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Вирус",
         transmission="Воздушно-капельный",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[1], SYMPTOMS_BY_ID[10]],
+        symptom_ids=(1, 10),
         prevention="Вакцинация (КПК)",
     ),
     Disease(
@@ -157,7 +183,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Вирус",
         transmission="Фекально-оральный",
         age_group=AgeGroup.under7,
-        symptoms=[SYMPTOMS_BY_ID[7], SYMPTOMS_BY_ID[6], SYMPTOMS_BY_ID[1]],
+        symptom_ids=(7, 6, 1),
         prevention="Гигиена, оральная регидратация",
     ),
     Disease(
@@ -166,7 +192,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Бактерия",
         transmission="Воздушно-капельный",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[1], SYMPTOMS_BY_ID[5], SYMPTOMS_BY_ID[10]],
+        symptom_ids=(1, 5, 10),
         prevention="Немедленное начало лечения, вакцинация",
     ),
     Disease(
@@ -175,7 +201,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Вирус",
         transmission="Воздушно-капельный",
         age_group=AgeGroup.preschool,
-        symptoms=[SYMPTOMS_BY_ID[4], SYMPTOMS_BY_ID[7], SYMPTOMS_BY_ID[9]],
+        symptom_ids=(4, 7, 9),
         prevention="Соблюдение гигиены, изоляция заболевших",
     ),
     Disease(
@@ -184,7 +210,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Вирус",
         transmission="Фекально-оральный",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[7], SYMPTOMS_BY_ID[6], SYMPTOMS_BY_ID[5]],
+        symptom_ids=(7, 6, 5),
         prevention="Гигиена, контроль качества воды и пищи",
     ),
     Disease(
@@ -193,7 +219,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Вирус",
         transmission="Воздушно-капельный",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[1], SYMPTOMS_BY_ID[5], SYMPTOMS_BY_ID[3]],
+        symptom_ids=(1, 5, 3),
         prevention="Ежегодная вакцинация, изоляция заболевших",
     ),
     Disease(
@@ -202,7 +228,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Вирус",
         transmission="Воздушно-капельный",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[4], SYMPTOMS_BY_ID[3], SYMPTOMS_BY_ID[5]],
+        symptom_ids=(4, 3, 5),
         prevention="Гигиена и поддерживающая терапия",
     ),
     Disease(
@@ -211,7 +237,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Бактерия",
         transmission="Контактный",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[8], SYMPTOMS_BY_ID[1], SYMPTOMS_BY_ID[5]],
+        symptom_ids=(8, 1, 5),
         prevention="Рациональная антибактериальная терапия",
     ),
     Disease(
@@ -220,7 +246,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Бактерия",
         transmission="Воздушно-капельный",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[8], SYMPTOMS_BY_ID[1]],
+        symptom_ids=(8, 1),
         prevention="Вакцинация (АКДС)",
     ),
     Disease(
@@ -229,7 +255,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Бактерии",
         transmission="Фекально-оральный",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[6], SYMPTOMS_BY_ID[7]],
+        symptom_ids=(6, 7),
         prevention="Соблюдение правил пищевой безопасности",
     ),
     # -------- дополнительные заболевания 16–45 --------
@@ -239,7 +265,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Вирус",
         transmission="Фекально-оральный",
         age_group=AgeGroup.under7,
-        symptoms=[SYMPTOMS_BY_ID[7], SYMPTOMS_BY_ID[6], SYMPTOMS_BY_ID[5]],
+        symptom_ids=(7, 6, 5),
         prevention="Гигиена рук, контроль качества пищи и воды",
     ),
     Disease(
@@ -248,7 +274,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Вирус",
         transmission="Воздушно-капельный",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[1], SYMPTOMS_BY_ID[3], SYMPTOMS_BY_ID[4]],
+        symptom_ids=(1, 3, 4),
         prevention="Гигиена, масочный режим в сезон подъёма заболеваемости",
     ),
     Disease(
@@ -257,7 +283,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Вирус",
         transmission="Воздушно-капельный",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[3], SYMPTOMS_BY_ID[4], SYMPTOMS_BY_ID[1]],
+        symptom_ids=(3, 4, 1),
         prevention="Изоляция заболевших, гигиена рук",
     ),
     Disease(
@@ -266,7 +292,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Вирус",
         transmission="Контактно-бытовой",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[9], SYMPTOMS_BY_ID[1]],
+        symptom_ids=(9, 1),
         prevention="Гигиена рук, индивидуальные полотенца",
     ),
     Disease(
@@ -275,7 +301,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Вирус",
         transmission="Контактно-бытовой",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[1], SYMPTOMS_BY_ID[10], SYMPTOMS_BY_ID[5]],
+        symptom_ids=(1, 10, 5),
         prevention="Ограничение бытовых контактов в период болезни",
     ),
     Disease(
@@ -284,7 +310,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Вирус",
         transmission="Контактно-бытовой",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[1], SYMPTOMS_BY_ID[5]],
+        symptom_ids=(1, 5),
         prevention="Соблюдение гигиены, обследование беременных",
     ),
     Disease(
@@ -293,7 +319,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Бактерия",
         transmission="Фекально-оральный",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[7], SYMPTOMS_BY_ID[6], SYMPTOMS_BY_ID[1]],
+        symptom_ids=(7, 6, 1),
         prevention="Термическая обработка продуктов, гигиена",
     ),
     Disease(
@@ -302,7 +328,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Бактерия",
         transmission="Фекально-оральный",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[7], SYMPTOMS_BY_ID[1], SYMPTOMS_BY_ID[5]],
+        symptom_ids=(7, 1, 5),
         prevention="Безопасная вода, санитарно-гигиенические мероприятия",
     ),
     Disease(
@@ -311,7 +337,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Паразит",
         transmission="Фекально-оральный",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[7], SYMPTOMS_BY_ID[5]],
+        symptom_ids=(7, 5),
         prevention="Кипячение воды, мытьё рук и овощей",
     ),
     Disease(
@@ -320,7 +346,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Бактерия",
         transmission="Фекально-оральный",
         age_group=AgeGroup.under7,
-        symptoms=[SYMPTOMS_BY_ID[7], SYMPTOMS_BY_ID[6]],
+        symptom_ids=(7, 6),
         prevention="Соблюдение санитарных норм, контроль питания детей",
     ),
     Disease(
@@ -329,7 +355,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Вирус",
         transmission="Контактно-бытовой",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[1], SYMPTOMS_BY_ID[8]],
+        symptom_ids=(1, 8),
         prevention="Исключение тесных контактов в период высыпаний",
     ),
     Disease(
@@ -338,7 +364,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Вирус",
         transmission="Фекально-оральный",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[1], SYMPTOMS_BY_ID[6], SYMPTOMS_BY_ID[7]],
+        symptom_ids=(1, 6, 7),
         prevention="Вакцинация, безопасная вода и пища",
     ),
     Disease(
@@ -347,7 +373,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Вирус",
         transmission="Контактный",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[1], SYMPTOMS_BY_ID[5]],
+        symptom_ids=(1, 5),
         prevention="Вакцинация, одноразовые инструменты",
     ),
     Disease(
@@ -356,7 +382,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Вирус",
         transmission="Трансмиссивный",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[1], SYMPTOMS_BY_ID[5]],
+        symptom_ids=(1, 5),
         prevention="Вакцинация, защита от клещей",
     ),
     Disease(
@@ -365,7 +391,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Бактерия",
         transmission="Трансмиссивный",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[2], SYMPTOMS_BY_ID[5], SYMPTOMS_BY_ID[10]],
+        symptom_ids=(2, 5, 10),
         prevention="Защита от клещей, раннее удаление клеща",
     ),
     Disease(
@@ -374,7 +400,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Бактерия",
         transmission="Контактно-бытовой",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[2], SYMPTOMS_BY_ID[1]],
+        symptom_ids=(2, 1),
         prevention="Гигиена кожи, обработка микротравм",
     ),
     Disease(
@@ -383,7 +409,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Бактерия",
         transmission="Контактно-бытовой",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[2]],
+        symptom_ids=(2,),
         prevention="Гигиена, изоляция ребёнка до заживления элементов",
     ),
     Disease(
@@ -392,7 +418,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Паразит",
         transmission="Контактно-бытовой",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[5]],
+        symptom_ids=(5,),
         prevention="Регулярный осмотр волос, обработка головных уборов",
     ),
     Disease(
@@ -401,7 +427,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Бактерия",
         transmission="Контактно-бытовой",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[2]],
+        symptom_ids=(2,),
         prevention="Гигиена, обработка кожных повреждений",
     ),
     Disease(
@@ -410,7 +436,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Вирус",
         transmission="Воздушно-капельный",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[3], SYMPTOMS_BY_ID[4], SYMPTOMS_BY_ID[1]],
+        symptom_ids=(3, 4, 1),
         prevention="Избегать переохлаждения, санация очагов инфекции",
     ),
     Disease(
@@ -419,7 +445,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Бактерия",
         transmission="Воздушно-капельный",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[3], SYMPTOMS_BY_ID[1], SYMPTOMS_BY_ID[5]],
+        symptom_ids=(3, 1, 5),
         prevention="Вакцинация против пневмококка, своевременное лечение ОРВИ",
     ),
     Disease(
@@ -428,7 +454,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Вирус",
         transmission="Воздушно-капельный",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[3], SYMPTOMS_BY_ID[4], SYMPTOMS_BY_ID[1]],
+        symptom_ids=(3, 4, 1),
         prevention="Профилактика ОРВИ, изоляция заболевших",
     ),
     Disease(
@@ -437,7 +463,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Бактерия",
         transmission="Воздушно-капельный",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[4], SYMPTOMS_BY_ID[5], SYMPTOMS_BY_ID[1]],
+        symptom_ids=(4, 5, 1),
         prevention="Лечение ринита, профилактика переохлаждения",
     ),
     Disease(
@@ -446,7 +472,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Бактерия",
         transmission="Восходящий путь из носоглотки",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[1], SYMPTOMS_BY_ID[5]],
+        symptom_ids=(1, 5),
         prevention="Лечение респираторных инфекций, защита ушей от воды",
     ),
     Disease(
@@ -455,7 +481,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Вирус",
         transmission="Воздушно-капельный",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[8], SYMPTOMS_BY_ID[1], SYMPTOMS_BY_ID[5]],
+        symptom_ids=(8, 1, 5),
         prevention="Гигиена, ограничение контактов в период заболеваемости",
     ),
     Disease(
@@ -464,7 +490,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Вирус",
         transmission="Фекально-оральный",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[1], SYMPTOMS_BY_ID[5]],
+        symptom_ids=(1, 5),
         prevention="Гигиена питания и рук",
     ),
     Disease(
@@ -473,7 +499,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Паразит",
         transmission="Контактно-бытовой",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[10], SYMPTOMS_BY_ID[5]],
+        symptom_ids=(10, 5),
         prevention="Термическая обработка мяса, гигиена при уходе за животными",
     ),
     Disease(
@@ -482,7 +508,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Паразит",
         transmission="Фекально-оральный",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[7], SYMPTOMS_BY_ID[5]],
+        symptom_ids=(7, 5),
         prevention="Гигиена рук, коротко подстриженные ногти, обработка постельного белья",
     ),
     Disease(
@@ -491,7 +517,7 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Грибок",
         transmission="Контактно-бытовой",
         age_group=AgeGroup.preschool,
-        symptoms=[SYMPTOMS_BY_ID[8]],
+        symptom_ids=(8,),
         prevention="Гигиена полости рта, стерильность сосок и бутылочек",
     ),
     Disease(
@@ -500,52 +526,147 @@ DISEASES_DB: List[Disease] = [
         pathogen_type="Вирус",
         transmission="Воздушно-капельный",
         age_group=AgeGroup.children,
-        symptoms=[SYMPTOMS_BY_ID[2], SYMPTOMS_BY_ID[1], SYMPTOMS_BY_ID[5]],
+        symptom_ids=(2, 1, 5),
         prevention="Изоляция заболевших, соблюдение гигиены",
     ),
-]
+)
+
+DISEASES_BY_ID: Dict[int, Disease] = {d.id: d for d in DISEASES_DB}
+
+# Готовые краткие описания (DiseaseShort) для списков, уже в виде JSON-совместимых словарей
+DISEASES_SHORT_BY_ID: Dict[int, dict] = {
+    d.id: {
+        "id": d.id,
+        "name": d.name,
+        "age_group": d.age_group.value,
+        "pathogen_type": d.pathogen_type,
+    }
+    for d in DISEASES_DB
+}
+
+# Заранее приведённые к нижнему регистру поля для фильтрации (в порядке DISEASES_DB).
+# casefold() — полное приведение регистра, корректное и для не-ASCII символов.
+_TRANS_LC: List[str] = [d.transmission.casefold() for d in DISEASES_DB]
+_PATH_LC: List[str] = [d.pathogen_type.casefold() for d in DISEASES_DB]
+_NAME_LC: List[str] = [d.name.casefold() for d in DISEASES_DB]
+
+
+def _build_symptom_index() -> Dict[int, List[dict]]:
+    """Обратный индекс: ID симптома -> краткие описания заболеваний с этим симптомом."""
+    index: Dict[int, List[dict]] = {}
+    for disease in DISEASES_DB:
+        for symptom_id in disease.symptom_ids:
+            index.setdefault(symptom_id, []).append(DISEASES_SHORT_BY_ID[disease.id])
+    return index
+
+
+DISEASES_BY_SYMPTOM: Dict[int, List[dict]] = _build_symptom_index()
 
 # Сезонная статистика за несколько лет
-STATISTICS_DB: List[StatisticItem] = []
-YEARS = [2021, 2022, 2023]
-
-for disease in DISEASES_DB:
-    base = 25 + disease.id * 6
-    for year in YEARS:
-        year_coeff = 0.9 + 0.1 * (year - YEARS[0])  # 2021 -> 0.9, 2022 -> 1.0, 2023 -> 1.1
-        base_year = int(base * year_coeff)
-
-        if disease.transmission == "Воздушно-капельный":
-            coeffs = {
-                Season.winter: 1.5,
-                Season.spring: 1.1,
-                Season.summer: 0.6,
-                Season.autumn: 1.0,
-            }
-        elif disease.transmission == "Фекально-оральный":
-            coeffs = {
-                Season.winter: 0.6,
-                Season.spring: 0.9,
-                Season.summer: 1.6,
-                Season.autumn: 1.2,
-            }
-        else:
-            coeffs = {
-                Season.winter: 1.0,
-                Season.spring: 1.1,
-                Season.summer: 0.9,
-                Season.autumn: 1.0,
-            }
-
-        for season, k in coeffs.items():
-            STATISTICS_DB.append(
-                StatisticItem(
-                    disease_id=disease.id,
-                    year=year,
-                    season=season,
-                    cases=int(base_year * k),
+YEARS: Tuple[int, ...] = (2021, 2022, 2023)
+
+# Сезонные коэффициенты по механизму передачи
+SEASON_COEFFS: Dict[str, Dict[Season, float]] = {
+    "Воздушно-капельный": {
+        Season.winter: 1.5,
+        Season.spring: 1.1,
+        Season.summer: 0.6,
+        Season.autumn: 1.0,
+    },
+    "Фекально-оральный": {
+        Season.winter: 0.6,
+        Season.spring: 0.9,
+        Season.summer: 1.6,
+        Season.autumn: 1.2,
+    },
+}
+DEFAULT_SEASON_COEFFS: Dict[Season, float] = {
+    Season.winter: 1.0,
+    Season.spring: 1.1,
+    Season.summer: 0.9,
+    Season.autumn: 1.0,
+}
+
+# 2021 -> 0.9, 2022 -> 1.0, 2023 -> 1.1
+YEAR_COEFFS = tuple((year, 0.9 + 0.1 * (year - YEARS[0])) for year in YEARS)
+
+
+def _generate_statistics() -> Tuple[StatisticItem, ...]:
+    statistics: List[StatisticItem] = []
+    for disease in DISEASES_DB:
+        base = 25 + disease.id * 6
+        coeffs = SEASON_COEFFS.get(disease.transmission, DEFAULT_SEASON_COEFFS).items()
+        for year, year_coeff in YEAR_COEFFS:
+            base_year = int(base * year_coeff)
+            for season, k in coeffs:
+                # значения заведомо корректны, поэтому валидация Pydantic пропускается
+                statistics.append(
+                    StatisticItem.model_construct(
+                        disease_id=disease.id,
+                        year=year,
+                        season=season,
+                        cases=int(base_year * k),
+                    )
                 )
-            )
+    return tuple(statistics)
+
+
+STATISTICS_DB: Tuple[StatisticItem, ...] = _generate_statistics()
+
+
+def _index_statistics() -> Tuple[
+    Dict[int, List[StatisticItem]],
+    Dict[int, List[StatisticItem]],
+    Dict[Season, List[StatisticItem]],
+]:
+    """Индексы статистики по заболеванию, году и сезону (записи в исходном порядке)."""
+    by_disease: Dict[int, List[StatisticItem]] = {}
+    by_year: Dict[int, List[StatisticItem]] = {}
+    by_season: Dict[Season, List[StatisticItem]] = {}
+    for stat in STATISTICS_DB:
+        by_disease.setdefault(stat.disease_id, []).append(stat)
+        by_year.setdefault(stat.year, []).append(stat)
+        by_season.setdefault(stat.season, []).append(stat)
+    return by_disease, by_year, by_season
+
+
+STATS_BY_DISEASE, STATS_BY_YEAR, STATS_BY_SEASON = _index_statistics()
+
+# ---------------------------------------------------------------------------
+# ЗАРАНЕЕ СЕРИАЛИЗОВАННЫЕ ОТВЕТЫ
+# ---------------------------------------------------------------------------
+
+# Справочники не меняются во время работы приложения, поэтому JSON
+# формируется один раз при импорте модуля.
+_SYMPTOMS_JSON: bytes = orjson.dumps([s.model_dump() for s in SYMPTOMS_DB])
+
+_STATISTICS_JSON: bytes = orjson.dumps([s.model_dump(mode="json") for s in STATISTICS_DB])
+
+# Значения для выпадающих списков фильтров, постоянные на всё время работы
+FILTER_META: Dict[str, Tuple[str, ...]] = {
+    "age_groups": tuple(sorted({d.age_group.value for d in DISEASES_DB})),
+    "transmissions": tuple(sorted({d.transmission for d in DISEASES_DB})),
+    "pathogen_types": tuple(sorted({d.pathogen_type for d in DISEASES_DB})),
+}
+
+_META_JSON: bytes = orjson.dumps(FILTER_META)
+
+_DISEASES_JSON: bytes = orjson.dumps(list(DISEASES_SHORT_BY_ID.values()))
+
+
+def make_etag(content: bytes) -> str:
+    return '"' + hashlib.blake2b(content, digest_size=16).hexdigest() + '"'
+
+
+def json_with_etag(value) -> Tuple[bytes, str]:
+    """Сериализует значение в JSON и вычисляет для результата ETag."""
+    content = orjson.dumps(value)
+    return content, make_etag(content)
+
+
+_SYMPTOMS_ETAG = make_etag(_SYMPTOMS_JSON)
+_META_ETAG = make_etag(_META_JSON)
+_DISEASES_ETAG = make_etag(_DISEASES_JSON)
 
 # ---------------------------------------------------------------------------
 # ВСПОМОГАТЕЛЬНЫЕ ФУНКЦИИ
@@ -553,15 +674,221 @@ for disease in DISEASES_DB:
 
 
 def get_disease_or_404(disease_id: int) -> Disease:
-    for disease in DISEASES_DB:
-        if disease.id == disease_id:
-            return disease
-    raise HTTPException(status_code=404, detail="Заболевание не найдено")
+    disease = DISEASES_BY_ID.get(disease_id)
+    if disease is None:
+        raise HTTPException(status_code=404, detail="Заболевание не найдено")
+    return disease
 
 
 def attach_stats(disease: Disease) -> DiseaseWithStats:
-    stats = [s for s in STATISTICS_DB if s.disease_id == disease.id]
-    return DiseaseWithStats(**disease.model_dump(), statistics=stats)
+    stats = STATS_BY_DISEASE.get(disease.id, [])
+    # данные уже провалидированы при заполнении "базы", повторная проверка не нужна
+    return DiseaseWithStats.model_construct(
+        id=disease.id,
+        name=disease.name,
+        pathogen_type=disease.pathogen_type,
+        transmission=disease.transmission,
+        age_group=disease.age_group,
+        symptoms=[SYMPTOMS_BY_ID[i] for i in disease.symptom_ids],
+        prevention=disease.prevention,
+        statistics=stats,
+    )
+
+
+# Ответы /diseases/{id} тоже неизменны: сериализуем их один раз, а не при каждом запросе
+DISEASE_DETAILS_JSON: Dict[int, bytes] = {
+    d.id: orjson.dumps(attach_stats(d).model_dump(mode="json")) for d in DISEASES_DB
+}
+DISEASE_DETAILS_ETAG: Dict[int, str] = {
+    disease_id: make_etag(content) for disease_id, content in DISEASE_DETAILS_JSON.items()
+}
+
+# То же для поиска по симптому: симптом -> (JSON, ETag)
+SYMPTOM_SEARCH_JSON: Dict[int, Tuple[bytes, str]] = {
+    symptom_id: json_with_etag(found) for symptom_id, found in DISEASES_BY_SYMPTOM.items()
+}
+
+# Данные справочные: пять минут ответ считается свежим, а после этого браузер
+# ещё сутки может показывать сохранённую копию, перепроверяя её в фоне
+JSON_CACHE_CONTROL = "public, max-age=300, stale-while-revalidate=86400"
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Проверяет, есть ли у клиента актуальная копия ответа (заголовок If-None-Match).
+
+    Сравнение слабое (RFC 9110, 13.1.2): прокси может пометить тег как W/"...".
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def cached_json_response(request: Request, content: bytes, etag: str) -> Response:
+    """Ответ с ETag; если у клиента уже есть актуальная копия, возвращается 304."""
+    headers = {"etag": etag, "cache-control": JSON_CACHE_CONTROL}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+# Варианты ответа по кодировке: None (без сжатия), "gzip", "br" -> (тело, ETag).
+# У каждого варианта свой ETag, так как это разные последовательности байтов.
+EncodedVariants = Dict[Optional[str], Tuple[bytes, str]]
+
+
+def precompress(content: bytes) -> EncodedVariants:
+    """Сжимает неизменный ответ один раз; Brotli используется, только если установлен."""
+    variants = {None: content, "gzip": gzip.compress(content, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(content, quality=11)
+    return {encoding: (body, make_etag(body)) for encoding, body in variants.items()}
+
+
+# Поддерживаемые сжатия в порядке предпочтения
+COMPRESSED_ENCODINGS = ("br", "gzip")
+
+
+def accepted_encodings(request: Request) -> Dict[str, float]:
+    """Веса кодировок из Accept-Encoding: имя -> q (0 означает запрет).
+
+    Нечитаемый вес считается равным 1; «*» задаёт вес для поддерживаемых
+    кодировок, не названных в заголовке отдельно.
+    """
+    weights: Dict[str, float] = {}
+    for item in request.headers.get("accept-encoding", "").split(","):
+        name, *params = item.split(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = min(max(float(value), 0.0), 1.0)
+                except ValueError:
+                    q = 1.0
+        weights[name] = q
+    if "*" in weights:
+        for encoding in COMPRESSED_ENCODINGS:
+            weights.setdefault(encoding, weights["*"])
+    return weights
+
+
+def negotiated_response(
+    request: Request,
+    variants: EncodedVariants,
+    media_type: str,
+    cache_control: str,
+) -> Response:
+    """Отдаёт заранее сжатый вариант, который поддерживает клиент, с ETag и 304."""
+    weights = accepted_encodings(request)
+    # наибольший вес выигрывает; при равных весах — порядок COMPRESSED_ENCODINGS
+    candidates = [e for e in COMPRESSED_ENCODINGS if weights.get(e, 0) > 0 and e in variants]
+    encoding = max(candidates, key=lambda e: weights[e], default=None)
+    content, etag = variants[encoding]
+
+    headers = {"etag": etag, "cache-control": cache_control, "vary": "Accept-Encoding"}
+    if encoding:
+        headers["content-encoding"] = encoding
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type=media_type, headers=headers)
+
+
+# Полная статистика — самый большой ответ API, поэтому она тоже сжимается заранее
+_STATISTICS_VARIANTS = precompress(_STATISTICS_JSON)
+
+
+# Строки для фильтрации: (заболевание, путь передачи, возбудитель, название) в нижнем регистре
+_FILTER_ROWS = tuple(zip(DISEASES_DB, _TRANS_LC, _PATH_LC, _NAME_LC))
+
+_FILTER_CONDITIONS = (
+    "trans_lc == t",
+    "d.age_group == a",
+    "path_lc == p",
+    "q in name_lc",
+)
+
+
+@lru_cache(maxsize=None)
+def compile_filter(has_t: bool, has_a: bool, has_p: bool, has_q: bool):
+    """Генерирует функцию отбора, проверяющую только заданные фильтры.
+
+    Комбинаций фильтров всего 16, поэтому каждая компилируется один раз.
+    """
+    flags = (has_t, has_a, has_p, has_q)
+    conditions = [cond for cond, flag in zip(_FILTER_CONDITIONS, flags) if flag]
+    where = " if " + " and ".join(conditions) if conditions else ""
+    source = (
+        "def select_rows(t, a, p, q):\n"
+        "    return tuple(short[d.id] for d, trans_lc, path_lc, name_lc in rows"
+        + where + ")\n"
+    )
+    namespace = {"rows": _FILTER_ROWS, "short": DISEASES_SHORT_BY_ID}
+    exec(source, namespace)
+    return namespace["select_rows"]
+
+
+def normalize_query(value: Optional[str]) -> Optional[str]:
+    """Приводит строковый параметр запроса к виду, в котором хранятся ключи фильтрации."""
+    return value.casefold().strip() if value else None
+
+
+@lru_cache(maxsize=256)
+def filter_diseases(
+    transmission: Optional[str],
+    age_group: Optional[AgeGroup],
+    pathogen_type: Optional[str],
+    q: Optional[str],
+) -> Tuple[dict, ...]:
+    """Отбор заболеваний по фильтрам (строковые параметры уже нормализованы)."""
+    select = compile_filter(
+        transmission is not None,
+        age_group is not None,
+        pathogen_type is not None,
+        q is not None,
+    )
+    return select(transmission, age_group, pathogen_type, q)
+
+
+@lru_cache(maxsize=256)
+def filter_diseases_json(
+    transmission: Optional[str],
+    age_group: Optional[AgeGroup],
+    pathogen_type: Optional[str],
+    q: Optional[str],
+) -> Tuple[bytes, str]:
+    """Результат filter_diseases в виде готового JSON вместе с ETag."""
+    return json_with_etag(filter_diseases(transmission, age_group, pathogen_type, q))
+
+
+@lru_cache(maxsize=256)
+def filter_statistics(
+    year: Optional[int],
+    season: Optional[Season],
+    disease_id: Optional[int],
+) -> Tuple[bytes, str]:
+    """Отбор статистики по фильтрам; результат кэшируется уже в виде JSON вместе с ETag."""
+    # начинаем с самого короткого из индексов, остальные условия проверяем за один проход
+    candidates = []
+    if year is not None:
+        candidates.append(STATS_BY_YEAR.get(year, []))
+    if season is not None:
+        candidates.append(STATS_BY_SEASON.get(season, []))
+    if disease_id is not None:
+        candidates.append(STATS_BY_DISEASE.get(disease_id, []))
+    stats = min(candidates, key=len) if candidates else STATISTICS_DB
+
+    return json_with_etag([
+        s.model_dump(mode="json") for s in stats
+        if (year is None or s.year == year)
+        and (season is None or s.season == season)
+        and (disease_id is None or s.disease_id == disease_id)
+    ])
 
 
 # ---------------------------------------------------------------------------
@@ -569,91 +896,96 @@ def attach_stats(disease: Disease) -> DiseaseWithStats:
 # ---------------------------------------------------------------------------
 
 
-@app.get("/diseases", response_model=List[DiseaseShort], tags=["Заболевания"])
-def list_diseases(
+@app.get(
+    "/diseases",
+    response_model=None,
+    responses={200: {"model": List[DiseaseShort]}},
+    tags=["Заболевания"],
+)
+async def list_diseases(
+    request: Request,
     transmission: Optional[str] = Query(None, description="Механизм передачи"),
     age_group: Optional[AgeGroup] = Query(None, description="Возрастная группа"),
     pathogen_type: Optional[str] = Query(None, description="Тип возбудителя"),
     q: Optional[str] = Query(None, description="Поиск по названию"),
-):
-    result = DISEASES_DB
-
-    if transmission:
-        t = transmission.lower().strip()
-        result = [d for d in result if d.transmission.lower() == t]
-
-    if age_group:
-        result = [d for d in result if d.age_group == age_group]
-
-    if pathogen_type:
-        p = pathogen_type.lower().strip()
-        result = [d for d in result if d.pathogen_type.lower() == p]
-
-    if q:
-        query_norm = q.lower().strip()
-        result = [d for d in result if query_norm in d.name.lower()]
-
-    return [
-        DiseaseShort(
-            id=d.id,
-            name=d.name,
-            age_group=d.age_group,
-            pathogen_type=d.pathogen_type,
-        )
-        for d in result
-    ]
+    offset: int = Query(0, ge=0, description="Сколько записей пропустить"),
+    limit: Optional[int] = Query(None, ge=1, description="Максимальное число записей"),
+) -> Response:
+    paged = offset > 0 or limit is not None
+    if not (transmission or age_group or pathogen_type or q or paged):
+        return cached_json_response(request, _DISEASES_JSON, _DISEASES_ETAG)
+
+    filters = (
+        normalize_query(transmission),
+        age_group,
+        normalize_query(pathogen_type),
+        normalize_query(q),
+    )
+    if not paged:
+        content, etag = filter_diseases_json(*filters)
+        return cached_json_response(request, content, etag)
+
+    rows = filter_diseases(*filters)
+
+    # постраничная выдача: общее число найденных записей передаётся в заголовке
+    end = None if limit is None else offset + limit
+    total = str(len(rows))
+    content = orjson.dumps(rows[offset:end])
+    # общее число входит в ETag: при том же срезе оно тоже должно совпадать
+    response = cached_json_response(request, content, make_etag(content + total.encode()))
+    response.headers["X-Total-Count"] = total
+    return response
 
 
 @app.get("/diseases/{disease_id}", response_model=DiseaseWithStats, tags=["Заболевания"])
-def get_disease(disease_id: int):
+async def get_disease(request: Request, disease_id: int) -> Response:
     disease = get_disease_or_404(disease_id)
-    return attach_stats(disease)
+    return cached_json_response(
+        request, DISEASE_DETAILS_JSON[disease.id], DISEASE_DETAILS_ETAG[disease.id]
+    )
 
 
 @app.get("/symptoms", response_model=List[Symptom], tags=["Симптомы"])
-def list_symptoms():
-    return SYMPTOMS_DB
+async def list_symptoms(request: Request) -> Response:
+    return cached_json_response(request, _SYMPTOMS_JSON, _SYMPTOMS_ETAG)
 
 
-@app.get("/search/by-symptom/{symptom_id}", response_model=List[DiseaseShort], tags=["Поиск"])
-def search_by_symptom(symptom_id: int):
-    result = [d for d in DISEASES_DB if any(s.id == symptom_id for s in d.symptoms)]
+@app.get(
+    "/search/by-symptom/{symptom_id}",
+    response_model=None,
+    responses={200: {"model": List[DiseaseShort]}},
+    tags=["Поиск"],
+)
+async def search_by_symptom(request: Request, symptom_id: int) -> Response:
+    result = SYMPTOM_SEARCH_JSON.get(symptom_id)
     if not result:
         raise HTTPException(status_code=404, detail="Нет заболеваний с данным симптомом")
-    return [
-        DiseaseShort(
-            id=d.id,
-            name=d.name,
-            age_group=d.age_group,
-            pathogen_type=d.pathogen_type,
-        )
-        for d in result
-    ]
+    return cached_json_response(request, *result)
 
 
-@app.get("/statistics", response_model=List[StatisticItem], tags=["Статистика"])
-def get_statistics(
+@app.get(
+    "/statistics",
+    response_model=None,
+    responses={200: {"model": List[StatisticItem]}},
+    tags=["Статистика"],
+)
+async def get_statistics(
+    request: Request,
     year: Optional[int] = Query(None, description="Год наблюдения"),
     season: Optional[Season] = Query(None, description="Сезон"),
     disease_id: Optional[int] = Query(None, description="ID заболевания"),
-):
-    stats = STATISTICS_DB
-    if year is not None:
-        stats = [s for s in stats if s.year == year]
-    if season is not None:
-        stats = [s for s in stats if s.season == season]
-    if disease_id is not None:
-        stats = [s for s in stats if s.disease_id == disease_id]
-    return stats
+) -> Response:
+    if year is None and season is None and disease_id is None:
+        return negotiated_response(
+            request, _STATISTICS_VARIANTS, "application/json", JSON_CACHE_CONTROL
+        )
 
+    return cached_json_response(request, *filter_statistics(year, season, disease_id))
 
-@app.get("/meta/filters", tags=["Служебные"])
-def filter_meta() -> Dict[str, List[str]]:
-    return {
-        "age_groups": sorted({d.age_group.value for d in DISEASES_DB}),
-        "transmissions": sorted({d.transmission for d in DISEASES_DB}),
-        "pathogen_types": sorted({d.pathogen_type for d in DISEASES_DB}),
-    }
+
+@app.get("/meta/filters", response_model=Dict[str, List[str]], tags=["Служебные"])
+async def filter_meta(request: Request) -> Response:
+    return cached_json_response(request, _META_JSON, _META_ETAG)
 
 
 # ---------------------------------------------------------------------------
@@ -661,15 +993,13 @@ def filter_meta() -> Dict[str, List[str]]:
 # ---------------------------------------------------------------------------
 
 
-@app.get("/", response_class=HTMLResponse)
-def index():
-    return """
+# Страница статична, поэтому кодируется в UTF-8 один раз при импорте модуля
+INDEX_HTML: bytes = """
     <!DOCTYPE html>
     <html lang="ru">
     <head>
         <meta charset="UTF-8">
         <title>Система по детским инфекционным заболеваниям</title>
-        <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
         <style>
             :root {
                 --blue: #2563eb;
@@ -860,6 +1190,30 @@ def index():
                 font-size: 13px;
                 margin-bottom: 6px;
             }
+            .table-scroll {
+                max-height: 520px;
+                overflow-y: auto;
+                margin-top: 4px;
+            }
+            .table-scroll thead th {
+                position: sticky;
+                top: 0;
+                z-index: 1;
+            }
+            /* строки одной высоты (текст в одну строку с многоточием) —
+               на этом основана виртуализация таблицы */
+            .table-scroll table {
+                table-layout: fixed;
+            }
+            #tableBody > tr > td {
+                white-space: nowrap;
+                overflow: hidden;
+                text-overflow: ellipsis;
+            }
+            tr.spacer td {
+                padding: 0;
+                border: none;
+            }
             table {
                 width: 100%;
                 border-collapse: collapse;
@@ -899,18 +1253,18 @@ def index():
                 text-align: center;
             }
 
-            tbody tr:nth-child(even) {
+            #tableBody > tr.row-even {
                 background: #f9fafb;
             }
-            body.dark-theme tbody tr:nth-child(even) {
+            body.dark-theme #tableBody > tr.row-even {
                 background: #020617;
             }
 
-            tr:hover {
+            #tableBody > tr:hover {
                 background: #f3f4ff;
                 cursor: pointer;
             }
-            body.dark-theme tr:hover {
+            body.dark-theme #tableBody > tr:hover {
                 background: #0b1120;
             }
             .row-selected {
@@ -1083,6 +1437,10 @@ def index():
         </style>
     </head>
     <body>
+        <script>
+            // тема применяется до отрисовки содержимого страницы, чтобы не было мигания светлой темы
+            if (localStorage.getItem("theme") === "dark") document.body.classList.add("dark-theme");
+        </script>
         <header>
             <div>
                 <h1>Сетевая информационная система по детским инфекционным заболеваниям</h1>
@@ -1121,11 +1479,12 @@ def index():
                         Можно отфильтровать по возрасту, механизму передачи или отдельному симптому.
                         Кликните по строке в таблице, чтобы увидеть подробное описание.
                     </div>
+                    <div id="tableScroll" class="table-scroll">
                     <table>
                         <thead>
                             <tr>
-                                <th id="th-id" data-col="id">ID</th>
-                                <th id="th-name" data-col="name">Заболевание</th>
+                                <th id="th-id" data-sort="id">ID</th>
+                                <th id="th-name" data-sort="name">Заболевание</th>
                                 <th>Возбудитель</th>
                                 <th style="width:220px;">Возрастная группа</th>
                             </tr>
@@ -1134,6 +1493,7 @@ def index():
                             <tr><td colspan="4">Загрузка...</td></tr>
                         </tbody>
                     </table>
+                    </div>
                     <div class="toolbar">
                         <button onclick="exportData('csv')">Экспорт в CSV</button>
                         <button onclick="exportData('json')">Экспорт в JSON</button>
@@ -1164,11 +1524,32 @@ def index():
             let currentDisease = null;
             let currentYear = null;
             let selectedId = null;
+            let selectedRowEl = null;
+
+            // Ссылки на постоянные элементы страницы получаем один раз
+            // (скрипт подключён в конце <body>, DOM к этому моменту уже построен)
+            const byId = id => document.getElementById(id);
+            const els = {
+                tbody: byId("tableBody"),
+                tableScroll: byId("tableScroll"),
+                counter: byId("counter"),
+                details: byId("details"),
+                chart: byId("statsChart"),
+                selectionInfo: byId("selectionInfo"),
+                yearSelect: byId("yearSelect"),
+                thead: document.querySelector("#tableScroll thead"),
+                sortHeaders: document.querySelectorAll("th[data-sort]"),
+                search: byId("search"),
+                ageGroup: byId("ageGroup"),
+                transmission: byId("transmission"),
+                symptomFilter: byId("symptomFilter"),
+                themeToggle: byId("themeToggle"),
+            };
 
             // ----------- ТЁМНАЯ / СВЕТЛАЯ ТЕМА -----------
 
             function updateThemeToggleText() {
-                const btn = document.getElementById("themeToggle");
+                const btn = els.themeToggle;
                 if (!btn) return;
                 if (document.body.classList.contains("dark-theme")) {
                     btn.textContent = "☀️ Светлая тема";
@@ -1178,103 +1559,242 @@ def index():
             }
 
             function toggleTheme() {
-                document.body.classList.toggle("dark-theme");
-                const isDark = document.body.classList.contains("dark-theme");
+                const isDark = document.body.classList.toggle("dark-theme");
                 localStorage.setItem("theme", isDark ? "dark" : "light");
                 updateThemeToggleText();
             }
 
+            // Сама тема уже применена встроенным скриптом в начале <body>;
+            // подпись кнопки не влияет на первую отрисовку и обновляется в свободное время
+            const whenIdle = window.requestIdleCallback
+                ? fn => requestIdleCallback(fn, { timeout: 500 })
+                : fn => setTimeout(fn, 1);
+
             function initTheme() {
-                const saved = localStorage.getItem("theme");
-                if (saved === "dark") {
-                    document.body.classList.add("dark-theme");
-                }
-                updateThemeToggleText();
+                whenIdle(updateThemeToggleText);
             }
 
-            // ----------- debounce для поля поиска -----------
+            // ----------- debounce для фильтров -----------
 
+            // cancel() снимает отложенный вызов (например, при немедленной загрузке по Enter)
             function debounce(fn, delay) {
                 let timeout;
-                return function(...args) {
+                const debounced = function(...args) {
                     clearTimeout(timeout);
                     timeout = setTimeout(() => fn.apply(this, args), delay);
                 };
+                debounced.cancel = () => clearTimeout(timeout);
+                return debounced;
             }
 
             // ---------------- Загрузка справочных данных для фильтров ----------------
 
-            async function loadFilters() {
+            // Справочники кэшируются в localStorage: при повторном открытии страницы
+            // списки заполняются сразу, а актуальные данные подгружаются в фоне.
+            // При изменении формата данных нужно сменить версию ключа.
+            const FILTERS_CACHE_KEY = "meta_v1";
+
+            function readCachedFilters() {
                 try {
-                    const [metaResp, sympResp] = await Promise.all([
-                        fetch("/meta/filters"),
-                        fetch("/symptoms")
-                    ]);
-
-                    if (metaResp.ok) {
-                        const meta = await metaResp.json();
-                        const ageSelect = document.getElementById("ageGroup");
-                        const trSelect = document.getElementById("transmission");
-
-                        meta.age_groups.forEach(value => {
-                            const opt = document.createElement("option");
-                            opt.value = value;
-                            opt.textContent = value;
-                            ageSelect.appendChild(opt);
-                        });
+                    return JSON.parse(localStorage.getItem(FILTERS_CACHE_KEY) || "null");
+                } catch (e) {
+                    return null;
+                }
+            }
 
-                        meta.transmissions.forEach(value => {
-                            const opt = document.createElement("option");
-                            opt.value = value;
-                            opt.textContent = value;
-                            trSelect.appendChild(opt);
-                        });
-                    }
+            function fillSelect(select, pairs) {
+                const current = select.value;
+                select.length = 1; // оставляем только пункт «Все ...»
+                select.insertAdjacentHTML("beforeend", optionsHtml(pairs));
+                select.value = current;
+                if (select.value !== current) select.value = "";
+            }
 
-                    if (sympResp.ok) {
-                        const symptoms = await sympResp.json();
-                        const symSelect = document.getElementById("symptomFilter");
-                        symptoms.forEach(s => {
-                            const opt = document.createElement("option");
-                            opt.value = s.id;
-                            opt.textContent = s.name;
-                            symSelect.appendChild(opt);
-                        });
-                    }
+            function populateFilters({ meta, symptoms }) {
+                if (meta) {
+                    fillSelect(els.ageGroup, meta.age_groups.map(v => [v, v]));
+                    fillSelect(els.transmission, meta.transmissions.map(v => [v, v]));
+                }
+                if (symptoms) {
+                    fillSelect(els.symptomFilter, symptoms.map(s => [s.id, s.name]));
+                }
+            }
 
-                    // подписываемся на изменения фильтров после их создания
-                    const searchInput = document.getElementById("search");
-                    const ageSelect = document.getElementById("ageGroup");
-                    const trSelect = document.getElementById("transmission");
-                    const symSelect = document.getElementById("symptomFilter");
-
-                    const debouncedLoad = debounce(loadDiseases, 300);
-                    searchInput.addEventListener("input", debouncedLoad);
-                    ageSelect.addEventListener("change", loadDiseases);
-                    trSelect.addEventListener("change", loadDiseases);
-                    symSelect.addEventListener("change", loadDiseases);
+            async function fetchFilters() {
+                const [metaResp, sympResp] = await Promise.all([
+                    fetch("/meta/filters"),
+                    fetch("/symptoms")
+                ]);
+                return {
+                    meta: metaResp.ok ? await metaResp.json() : null,
+                    symptoms: sympResp.ok ? await sympResp.json() : null,
+                };
+            }
+
+            async function refreshFilters(cached) {
+                try {
+                    const fresh = await fetchFilters();
+                    const serialized = JSON.stringify(fresh);
+                    if (cached && serialized === JSON.stringify(cached)) return;
+                    populateFilters(fresh);
+                    if (fresh.meta && fresh.symptoms) {
+                        localStorage.setItem(FILTERS_CACHE_KEY, serialized);
+                    }
                 } catch (e) {
                     console.error("Ошибка загрузки фильтров", e);
                 }
             }
 
+            function bindFilterEvents() {
+                // все фильтры идут через debounce: быстрый набор и переключения дают один запрос
+                const debouncedSearch = debounce(queueLoadDiseases, 250);
+                els.search.addEventListener("input", debouncedSearch);
+                // Enter — загрузка сразу, без ожидания таймера
+                els.search.addEventListener("keydown", e => {
+                    if (e.key !== "Enter") return;
+                    debouncedSearch.cancel();
+                    queueLoadDiseases();
+                });
+
+                const debouncedLoad = debounce(queueLoadDiseases, 200);
+                [els.ageGroup, els.transmission, els.symptomFilter].forEach(select => {
+                    select.addEventListener("input", debouncedLoad);
+                    select.addEventListener("change", debouncedLoad);
+                });
+            }
+
+            // Значения фильтров хранятся в sessionStorage: после перезагрузки вкладки
+            // список сразу запрашивается с теми же условиями
+            const FILTER_STATE_KEY = "filter_state_v1";
+            const FILTER_FIELDS = ["search", "ageGroup", "transmission", "symptomFilter"];
+
+            function saveFilterState() {
+                const state = {};
+                for (const name of FILTER_FIELDS) state[name] = els[name].value;
+                try {
+                    sessionStorage.setItem(FILTER_STATE_KEY, JSON.stringify(state));
+                } catch (e) {
+                    // хранилище недоступно — состояние просто не сохраняется
+                }
+            }
+
+            function restoreFilterState() {
+                let state = null;
+                try {
+                    state = JSON.parse(sessionStorage.getItem(FILTER_STATE_KEY) || "null");
+                } catch (e) {
+                    return;
+                }
+                if (!state) return;
+                for (const name of FILTER_FIELDS) {
+                    if (typeof state[name] === "string") els[name].value = state[name];
+                }
+            }
+
+            async function loadFilters() {
+                const cached = readCachedFilters();
+                if (cached) populateFilters(cached);
+                bindFilterEvents();
+
+                const refresh = refreshFilters(cached);
+                // без кэша ждём справочники, с кэшем — обновляем их в фоне
+                if (!cached) await refresh;
+                // значения восстанавливаются, когда пункты списков уже на месте
+                restoreFilterState();
+            }
+
+            // ---------------- Кэш ответов сервера ----------------
+
+            // LRU-кэш по URL: свежие записи отдаются без запроса, устаревшие
+            // перепроверяются через If-None-Match (сервер отвечает 304, если данные не изменились)
+            const RESPONSE_CACHE_SIZE = 32;
+            const RESPONSE_CACHE_TTL = 60 * 1000;
+            const responseCache = new Map();
+
+            function cacheGet(url) {
+                const entry = responseCache.get(url);
+                if (entry) {
+                    // перемещаем запись в конец Map — она становится самой «свежей»
+                    responseCache.delete(url);
+                    responseCache.set(url, entry);
+                }
+                return entry;
+            }
+
+            function cachePut(url, entry) {
+                responseCache.delete(url);
+                responseCache.set(url, entry);
+                if (responseCache.size > RESPONSE_CACHE_SIZE) {
+                    responseCache.delete(responseCache.keys().next().value);
+                }
+            }
+
+            async function cachedFetch(url, options = {}) {
+                const cached = cacheGet(url);
+                if (cached && Date.now() - cached.time < RESPONSE_CACHE_TTL) return cached;
+
+                const headers = {};
+                if (cached && cached.etag) headers["If-None-Match"] = cached.etag;
+                const response = await fetch(url, { ...options, headers });
+
+                if (response.status === 304 && cached) {
+                    cached.time = Date.now();
+                    return cached;
+                }
+
+                const entry = {
+                    ok: response.ok,
+                    etag: response.headers.get("ETag"),
+                    data: response.ok ? await response.json() : null,
+                    time: Date.now(),
+                };
+                if (response.ok) cachePut(url, entry);
+                return entry;
+            }
+
             // ---------------- Загрузка списка заболеваний ----------------
 
-            async function loadDiseases() {
-                const symptomId = document.getElementById("symptomFilter").value;
-                if (symptomId) {
-                    await loadDiseasesBySymptom(symptomId);
-                } else {
-                    await loadDiseasesStandard();
+            let currentAbort = null;
+
+            // Запрос списка с отменой предыдущего, ещё не завершённого.
+            // Возвращает null, если запрос был отменён более новым.
+            async function fetchLatest(url) {
+                if (currentAbort) currentAbort.abort();
+                const controller = new AbortController();
+                currentAbort = controller;
+                try {
+                    return await cachedFetch(url, { signal: controller.signal });
+                } catch (e) {
+                    if (e.name === "AbortError") return null;
+                    throw e;
+                } finally {
+                    if (currentAbort === controller) currentAbort = null;
                 }
-                applySorting();
-                renderTable();
+            }
+
+            // Все изменения фильтров до ближайшего кадра сводятся к одной загрузке:
+            // loadDiseases читает значения полей в момент выполнения, то есть последнее состояние
+            function queueLoadDiseases() {
+                scheduleFrame(loadDiseases, READ);
+            }
+
+            async function loadDiseases() {
+                saveFilterState();
+                const symptomId = els.symptomFilter.value;
+                const applied = symptomId
+                    ? await loadDiseasesBySymptom(symptomId)
+                    : await loadDiseasesStandard();
+                if (!applied) return;
+                sortLoadedData();
+                scheduleRender();
             }
 
             async function loadDiseasesStandard() {
-                const q = document.getElementById("search").value.trim();
-                const age = document.getElementById("ageGroup").value;
-                const tr = document.getElementById("transmission").value;
+                // строка поиска нормализуется один раз: «Грипп» и «грипп » дают один URL,
+                // а значит, один запрос и одну запись в кэше ответов
+                const q = els.search.value.trim().toLowerCase();
+                const age = els.ageGroup.value;
+                const tr = els.transmission.value;
 
                 const params = new URLSearchParams();
                 if (q) params.append("q", q);
@@ -1282,146 +1802,303 @@ def index():
                 if (tr) params.append("transmission", tr);
 
                 const url = "/diseases" + (params.toString() ? "?" + params.toString() : "");
-                const response = await fetch(url);
-                const data = await response.json();
+                const result = await fetchLatest(url);
+                if (!result) return false;
+                // копия: сортировка на странице не должна менять ответ, сохранённый в кэше
+                const data = (result.data || []).slice();
                 lastData = data;
                 updateCounter("Найдено записей: " + data.length + " из " + totalCount);
+                return true;
             }
 
             async function loadDiseasesBySymptom(symptomId) {
-                const response = await fetch("/search/by-symptom/" + symptomId);
-                if (!response.ok) {
+                const result = await fetchLatest("/search/by-symptom/" + symptomId);
+                if (!result) return false;
+                if (!result.ok) {
                     lastData = [];
                     updateCounter("По выбранному симптому заболевания не найдены.");
-                    renderTable();
-                    return;
+                    return true;
                 }
-                const data = await response.json();
+                const data = result.data.slice();
                 lastData = data;
                 updateCounter("Найдено по выбранному симптому: " + data.length + " из " + totalCount);
+                return true;
             }
 
             function updateCounter(text) {
-                document.getElementById("counter").textContent = text;
+                els.counter.textContent = text;
             }
 
             // ---------------- Сортировка таблицы ----------------
 
+            // сравнение названий без учёта регистра по правилам русского алфавита;
+            // строки не приводятся к нижнему регистру при каждом сравнении
+            const nameCollator = new Intl.Collator("ru", { sensitivity: "base" });
+
             function applySorting() {
                 if (!lastData || !lastData.length) return;
-                const col = sortState.column;
                 const dir = sortState.direction === 'asc' ? 1 : -1;
 
-                lastData.sort((a, b) => {
-                    let va = a[col];
-                    let vb = b[col];
-                    if (col === 'name') {
-                        va = va.toLowerCase();
-                        vb = vb.toLowerCase();
-                    }
-                    if (va < vb) return -1 * dir;
-                    if (va > vb) return 1 * dir;
-                    return 0;
-                });
+                if (sortState.column === 'name') {
+                    lastData.sort((a, b) => nameCollator.compare(a.name, b.name) * dir);
+                } else {
+                    lastData.sort((a, b) => (a.id - b.id) * dir);
+                }
+            }
+
+            // Сервер отдаёт списки в порядке возрастания ID,
+            // поэтому для сортировки по ID после загрузки полный sort не нужен
+            function sortLoadedData() {
+                if (sortState.column !== 'id') {
+                    applySorting();
+                } else if (sortState.direction === 'desc') {
+                    lastData.reverse();
+                }
             }
 
             function setSort(column) {
                 if (sortState.column === column) {
+                    // данные уже отсортированы по этой колонке — достаточно развернуть за O(N)
                     sortState.direction = sortState.direction === 'asc' ? 'desc' : 'asc';
+                    if (lastData) lastData.reverse();
                 } else {
                     sortState.column = column;
                     sortState.direction = 'asc';
+                    applySorting();
                 }
-                applySorting();
-                updateSortHeaderStyles();
-                renderTable();
+                // заголовки и строки обновляются в одном кадре
+                scheduleFrame(updateSortHeaderStyles);
+                scheduleRender();
             }
 
             function updateSortHeaderStyles() {
-                const thId = document.getElementById("th-id");
-                const thName = document.getElementById("th-name");
-                thId.classList.remove("sort-asc", "sort-desc");
-                thName.classList.remove("sort-asc", "sort-desc");
-
-                const target = sortState.column === 'id' ? thId : thName;
-                target.classList.add(sortState.direction === 'asc' ? "sort-asc" : "sort-desc");
+                els.sortHeaders.forEach(th => {
+                    const active = th.dataset.sort === sortState.column;
+                    th.classList.toggle("sort-asc", active && sortState.direction === 'asc');
+                    th.classList.toggle("sort-desc", active && sortState.direction === 'desc');
+                });
             }
 
             // ---------------- Вспомогательные функции ----------------
 
-            function getPathogenClass(type) {
+            // Пакетная обработка по кадрам: задачи разделены на уровни
+            // (READ — чтение размеров, WRITE — изменение DOM, MEASURE — чтение после записи)
+            // и выполняются в одном requestAnimationFrame строго по уровням,
+            // поэтому чтения и записи не чередуются и лишних пересчётов разметки нет.
+            const READ = 0, WRITE = 1, MEASURE = 2;
+
+            const frameBatch = (() => {
+                const levels = [[], [], []];
+                let scheduled = false;
+                let flushing = -1;
+
+                function flush() {
+                    scheduled = false;
+                    for (let level = 0; level < levels.length; level++) {
+                        flushing = level;
+                        const tasks = levels[level];
+                        levels[level] = [];
+                        for (const fn of tasks) fn();
+                    }
+                    flushing = -1;
+                }
+
+                return {
+                    add(level, fn) {
+                        levels[level].push(fn);
+                        // задача более позднего уровня, добавленная во время обработки,
+                        // выполняется в этом же кадре; иначе — в следующем
+                        if (!scheduled && (flushing < 0 || level <= flushing)) {
+                            scheduled = true;
+                            requestAnimationFrame(flush);
+                        }
+                    },
+                };
+            })();
+
+            // Отрисовка не чаще одного раза за кадр: повторные вызовы до ближайшего
+            // кадра объединяются в одну перерисовку
+            const scheduledFrames = new Set();
+
+            function scheduleFrame(fn, level = WRITE) {
+                if (scheduledFrames.has(fn)) return;
+                scheduledFrames.add(fn);
+                frameBatch.add(level, () => {
+                    scheduledFrames.delete(fn);
+                    fn();
+                });
+            }
+
+            function scheduleRender() {
+                scheduleFrame(renderTable);
+            }
+
+            function scheduleDetailsRender() {
+                scheduleFrame(renderDetailsAndChart);
+            }
+
+            const HTML_ESCAPES = { "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;" };
+
+            function escapeHtml(value) {
+                return String(value ?? "").replace(/[&<>"']/g, ch => HTML_ESCAPES[ch]);
+            }
+
+            // пары [значение, подпись] -> HTML-строка с <option> для вставки одним действием
+            function optionsHtml(pairs) {
+                return pairs
+                    .map(([value, label]) => `<option value="${escapeHtml(value)}">${escapeHtml(label)}</option>`)
+                    .join("");
+            }
+
+            // Значений типа возбудителя и возрастной группы всего несколько,
+            // поэтому результаты оформления запоминаются по исходной строке
+            function memoize(fn) {
+                const cache = new Map();
+                return value => {
+                    if (cache.has(value)) return cache.get(value);
+                    const result = fn(value);
+                    cache.set(value, result);
+                    return result;
+                };
+            }
+
+            const getPathogenClass = memoize(type => {
                 const t = (type || "").toLowerCase();
                 if (t.includes("вирус")) return "badge-virus";
                 if (t.includes("бактер")) return "badge-bacteria";
                 return "badge-other";
-            }
+            });
 
-            function getAgeLabel(age) {
+            const getAgeLabel = memoize(age => {
                 if (!age) return age;
                 if (age.includes("Дошкольный")) return "👶 " + age;
                 if (age.includes("до 7")) return "🧒 " + age;
                 return "🧑‍🎓 " + age;
-            }
+            });
 
             // ---------------- Отрисовка таблицы ----------------
 
-            function onRowClick(id) {
-                selectedId = id;
-                renderTable();
-                loadDiseaseDetails(id);
+            function onRowClick(tr) {
+                // переключаем выделение только у двух строк, без перерисовки всей таблицы
+                if (selectedRowEl) selectedRowEl.classList.remove("row-selected");
+                tr.classList.add("row-selected");
+                selectedRowEl = tr;
+                selectedId = Number(tr.dataset.id);
+                loadDiseaseDetails(selectedId);
+            }
+
+            // Виртуализация: в DOM находятся только строки в видимой области (± overscanCount),
+            // остальное место занимают две строки-распорки, чтобы сохранить полосу прокрутки.
+            // Все строки одной высоты (см. CSS для #tableBody), поэтому её достаточно измерить один раз.
+            const overscanCount = 5;
+            let rowHeight = 0;
+            let rowsTop = 0;       // отступ первой строки от начала прокручиваемого содержимого
+            let headerHeight = 0;  // закреплённый заголовок закрывает верх видимой области
+            let renderedRange = null;
+            let scrollScheduled = false;
+
+            // Разметка ячеек (экранирование, значки) зависит только от данных строки,
+            // поэтому строится один раз на объект, а не при каждой прокрутке и сортировке.
+            // WeakMap, а не поле объекта: служебные данные не попадают в экспорт JSON.
+            const rowCellsCache = new WeakMap();
+
+            function rowCellsHtml(item) {
+                let cells = rowCellsCache.get(item);
+                if (cells === undefined) {
+                    cells = `
+                        <td>${item.id}</td>
+                        <td title="${escapeHtml(item.name)}">${escapeHtml(item.name)}</td>
+                        <td><span class="badge-pathogen ${getPathogenClass(item.pathogen_type)}">${escapeHtml(item.pathogen_type)}</span></td>
+                        <td><span class="badge">${escapeHtml(getAgeLabel(item.age_group))}</span></td>
+                    `;
+                    rowCellsCache.set(item, cells);
+                }
+                return cells;
+            }
+
+            // index — позиция в lastData; чётность строк задаётся классом, а не :nth-child,
+            // поэтому чередование фона не зависит от строк-распорок
+            function rowHtml(item, index) {
+                const classes = (index % 2 ? "row-even" : "") + (selectedId === item.id ? " row-selected" : "");
+                return `<tr data-id="${item.id}" class="${classes}">${rowCellsHtml(item)}</tr>`;
+            }
+
+            function spacerHtml(height) {
+                return height > 0
+                    ? `<tr class="spacer" style="height:${height}px"><td colspan="4"></td></tr>`
+                    : "";
+            }
+
+            // Индексы строк, попадающих в видимую область: [first, last).
+            // Верх области занят закреплённым заголовком, поэтому он не учитывается.
+            function visibleRows() {
+                const scroller = els.tableScroll;
+                const top = scroller.scrollTop - rowsTop;
+                const first = Math.max(0, Math.floor((top + headerHeight) / rowHeight));
+                const last = Math.max(first, Math.ceil((top + scroller.clientHeight) / rowHeight));
+                return { first, last };
+            }
+
+            function measureRows() {
+                // одна строка отрисовывается для замера высоты строки и положения первой строки
+                const tbody = els.tbody;
+                tbody.innerHTML = rowHtml(lastData[0], 0);
+                const scroller = els.tableScroll;
+                rowHeight = tbody.firstElementChild.offsetHeight || 37;
+                rowsTop = tbody.getBoundingClientRect().top - scroller.getBoundingClientRect().top + scroller.scrollTop;
+                headerHeight = els.thead.offsetHeight;
             }
 
             function renderTable() {
-                const tbody = document.getElementById("tableBody");
-                tbody.innerHTML = "";
+                const tbody = els.tbody;
 
                 if (!lastData || !lastData.length) {
-                    const row = document.createElement("tr");
-                    const cell = document.createElement("td");
-                    cell.colSpan = 4;
-                    cell.textContent = "Ничего не найдено.";
-                    row.appendChild(cell);
-                    tbody.appendChild(row);
+                    tbody.innerHTML = "<tr><td colspan='4'>Ничего не найдено.</td></tr>";
+                    selectedRowEl = null;
+                    renderedRange = null;
                     return;
                 }
 
-                lastData.forEach(item => {
-                    const row = document.createElement("tr");
-                    if (selectedId === item.id) {
-                        row.classList.add("row-selected");
+                if (!rowHeight) measureRows();
+
+                const total = lastData.length;
+                const { first, last } = visibleRows();
+                // область прокрутки может быть скрыта (нулевая высота) — тогда рисуем всё
+                const visibleCount = last - first || total;
+                // после смены фильтров прокрутка может оказаться за концом нового списка
+                const start = Math.max(0, Math.min(first - overscanCount, total - visibleCount - overscanCount));
+                const end = Math.min(total, start + visibleCount + 2 * overscanCount);
+
+                tbody.innerHTML =
+                    spacerHtml(start * rowHeight) +
+                    lastData.slice(start, end).map((item, i) => rowHtml(item, start + i)).join("") +
+                    spacerHtml((total - end) * rowHeight);
+                renderedRange = { start, end };
+                selectedRowEl = tbody.querySelector(".row-selected");
+            }
+
+            function onTableScroll() {
+                if (scrollScheduled) return;
+                scrollScheduled = true;
+                frameBatch.add(READ, () => {
+                    scrollScheduled = false;
+                    if (!renderedRange || !rowHeight) return;
+                    const { first, last } = visibleRows();
+                    // перерисовываем (в этом же кадре), только если видимая область вышла за отрисованный диапазон
+                    if (first < renderedRange.start || Math.min(last, lastData.length) > renderedRange.end) {
+                        scheduleRender();
                     }
-
-                    const idCell = document.createElement("td");
-                    idCell.textContent = item.id;
-
-                    const nameCell = document.createElement("td");
-                    nameCell.textContent = item.name;
-
-                    const pathogenCell = document.createElement("td");
-                    const pSpan = document.createElement("span");
-                    pSpan.className = "badge-pathogen " + getPathogenClass(item.pathogen_type);
-                    pSpan.textContent = item.pathogen_type;
-                    pathogenCell.appendChild(pSpan);
-
-                    const ageCell = document.createElement("td");
-                    const span = document.createElement("span");
-                    span.className = "badge";
-                    span.textContent = getAgeLabel(item.age_group);
-                    ageCell.appendChild(span);
-
-                    row.appendChild(idCell);
-                    row.appendChild(nameCell);
-                    row.appendChild(pathogenCell);
-                    row.appendChild(ageCell);
-
-                    row.addEventListener("click", () => onRowClick(item.id));
-
-                    tbody.appendChild(row);
                 });
             }
 
             // ---------------- Экспорт данных ----------------
 
+            // поле в кавычках, если в нём есть разделитель, кавычка или перевод строки
+            function csvEscape(value) {
+                const text = String(value ?? "");
+                return /[";\\r\\n]/.test(text) ? '"' + text.replace(/"/g, '""') + '"' : text;
+            }
+
             function exportData(format) {
                 if (!lastData || !lastData.length) {
                     alert("Нет данных для экспорта");
@@ -1436,10 +2113,14 @@ def index():
                     a.click();
                     URL.revokeObjectURL(url);
                 } else if (format === "csv") {
-                    const header = ["id", "name", "pathogen_type", "age_group"];
-                    const rows = lastData.map(d => [d.id, d.name, d.pathogen_type, d.age_group]);
-                    const csvLines = [header.join(";")].concat(rows.map(r => r.join(";")));
-                    const blob = new Blob([csvLines.join("\\n")], {type: "text/csv;charset=utf-8;"});
+                    // Blob собирается из небольших кусков байтов, без одной большой строки
+                    const enc = new TextEncoder();
+                    const chunks = [enc.encode("id;name;pathogen_type;age_group\\n")];
+                    for (const d of lastData) {
+                        const line = [d.id, csvEscape(d.name), csvEscape(d.pathogen_type), csvEscape(d.age_group)];
+                        chunks.push(enc.encode(line.join(";") + "\\n"));
+                    }
+                    const blob = new Blob(chunks, {type: "text/csv;charset=utf-8;"});
                     const url = URL.createObjectURL(blob);
                     const a = document.createElement("a");
                     a.href = url;
@@ -1451,73 +2132,203 @@ def index():
 
             // ---------------- Подробная информация и график ----------------
 
-            async function loadDiseaseDetails(id) {
-                const container = document.getElementById("details");
-                const chartCanvas = document.getElementById("statsChart");
-                const selectionInfo = document.getElementById("selectionInfo");
-                const yearSelect = document.getElementById("yearSelect");
+            // Подробности по заболеваниям не меняются: храним ответ и список лет по ID,
+            // повторный выбор строки отрисовывается сразу, без запроса к серверу.
+            // Это единственный кэш подробностей: они запрашиваются мимо cachedFetch,
+            // чтобы не вытеснять из его LRU ответы со списками.
+            const detailsCache = new Map();
+
+            const SEASON_ORDER = { "Зима": 0, "Весна": 1, "Лето": 2, "Осень": 3 };
+
+            // год -> статистика за этот год, упорядоченная по сезонам (сортировка один раз на заболевание)
+            function groupStatsByYear(statistics) {
+                const byYear = new Map();
+                for (const s of statistics) {
+                    const arr = byYear.get(s.year) || [];
+                    arr.push(s);
+                    byYear.set(s.year, arr);
+                }
+                for (const arr of byYear.values()) {
+                    arr.sort((a, b) => (SEASON_ORDER[a.season] ?? 0) - (SEASON_ORDER[b.season] ?? 0));
+                }
+                return byYear;
+            }
+
+            const detailsInFlight = new Map();
+
+            function fetchDiseaseDetails(id) {
+                if (detailsCache.has(id)) return Promise.resolve(detailsCache.get(id));
+                // повторный запрос того же ID (наведение, затем клик) ждёт уже идущий
+                if (detailsInFlight.has(id)) return detailsInFlight.get(id);
+
+                const promise = fetch("/diseases/" + id)
+                    .then(async response => {
+                        if (!response.ok) return null;
+                        const d = await response.json();
+                        d._statsByYear = groupStatsByYear(d.statistics);
+                        const entry = {
+                            d,
+                            years: Array.from(new Set(d.statistics.map(s => s.year))).sort(),
+                        };
+                        detailsCache.set(id, entry);
+                        return entry;
+                    })
+                    .finally(() => detailsInFlight.delete(id));
+                detailsInFlight.set(id, promise);
+                return promise;
+            }
+
+            // Предзагрузка подробностей при наведении на строку: к моменту клика
+            // данные обычно уже в detailsCache. Короткая задержка отсекает случайные проходы мышью.
+            const PREFETCH_DELAY = 80;
+            let prefetchTimer = null;
+            let hoveredRow = null;
+
+            function onTableHover(e) {
+                // mouseover всплывает от каждой ячейки: переходы внутри одной строки пропускаем,
+                // иначе таймер предзагрузки перезапускался бы при каждом движении мыши
+                const tr = e.target.closest("tr[data-id]");
+                if (tr === hoveredRow) return;
+                hoveredRow = tr;
+                clearTimeout(prefetchTimer);
+                if (!tr) return;
+                const id = Number(tr.dataset.id);
+                if (detailsCache.has(id)) return;
+                prefetchTimer = setTimeout(() => {
+                    fetchDiseaseDetails(id).catch(() => {});
+                }, PREFETCH_DELAY);
+            }
 
-                container.classList.remove("active");
-                container.innerHTML = "<div class='details-empty'>Загрузка подробной информации...</div>";
+            async function loadDiseaseDetails(id) {
+                const container = els.details;
+                const chartCanvas = els.chart;
+                const selectionInfo = els.selectionInfo;
+                const yearSelect = els.yearSelect;
+
+                let entry = detailsCache.get(id);
+                if (!entry) {
+                    container.classList.remove("active");
+                    container.innerHTML = "<div class='details-empty'>Загрузка подробной информации...</div>";
+                    chartCanvas.classList.remove("visible");
 
-                chartCanvas.classList.remove("visible");
+                    entry = await fetchDiseaseDetails(id);
+                    // пока шёл запрос, пользователь мог выбрать другое заболевание
+                    if (selectedId !== id) return;
+                }
 
-                const response = await fetch("/diseases/" + id);
-                if (!response.ok) {
+                if (!entry) {
                     container.innerHTML = "<div class='details-empty'>Ошибка загрузки данных.</div>";
                     chartCanvas.style.display = "none";
                     yearSelect.style.display = "none";
-                    if (statsChart) { statsChart.destroy(); statsChart = null; }
                     selectionInfo.textContent = "Заболевание не выбрано.";
                     return;
                 }
 
-                const d = await response.json();
+                const { d, years } = entry;
                 currentDisease = d;
+                container.classList.remove("active");
 
                 selectionInfo.textContent = "Выбрано заболевание: " + d.name + " (ID: " + d.id + ")";
 
-                const years = Array.from(new Set(d.statistics.map(s => s.year))).sort();
-                yearSelect.innerHTML = "";
-                years.forEach(y => {
-                    const opt = document.createElement("option");
-                    opt.value = y;
-                    opt.textContent = "Год: " + y;
-                    yearSelect.appendChild(opt);
-                });
+                yearSelect.replaceChildren(...years.map(y => new Option("Год: " + y, y)));
                 if (years.length) {
                     yearSelect.style.display = "inline-block";
                     currentYear = years[years.length - 1];
                     yearSelect.value = currentYear;
                     yearSelect.onchange = () => {
                         currentYear = parseInt(yearSelect.value);
-                        renderDetailsAndChart();
+                        scheduleDetailsRender();
                     };
                 } else {
                     yearSelect.style.display = "none";
                     currentYear = null;
                 }
 
-                renderDetailsAndChart();
+                scheduleDetailsRender();
+            }
+
+            // Chart.js загружается только при первом показе графика:
+            // при открытии страницы библиотека не скачивается и не разбирается.
+            // Версия зафиксирована, чтобы новый мажорный выпуск не подключился незаметно.
+            const CHART_JS_URL = "https://cdn.jsdelivr.net/npm/chart.js@4.4.1/auto/+esm";
+            let ChartLib = null;
+            let chartLibPromise = null;
+
+            function loadChartLib() {
+                if (!chartLibPromise) {
+                    chartLibPromise = import(CHART_JS_URL)
+                        .then(module => { ChartLib = module.Chart; })
+                        .catch(e => {
+                            chartLibPromise = null; // при следующем показе попробуем снова
+                            throw e;
+                        });
+                }
+                return chartLibPromise;
+            }
+
+            // График создаётся один раз; при смене заболевания или года меняются только данные
+            function createStatsChart(canvas) {
+                return new ChartLib(canvas.getContext("2d"), {
+                    type: "bar",
+                    data: {
+                        labels: [],
+                        datasets: [
+                            {
+                                type: "bar",
+                                label: "Число случаев",
+                                data: [],
+                                borderWidth: 1,
+                                yAxisID: "y",
+                            },
+                            {
+                                type: "line",
+                                label: "Доля от максимума, %",
+                                data: [],
+                                borderWidth: 2,
+                                fill: false,
+                                yAxisID: "y1",
+                            }
+                        ]
+                    },
+                    options: {
+                        interaction: { mode: "index", intersect: false },
+                        animation: {
+                            duration: 700,
+                            easing: "easeOutQuart"
+                        },
+                        plugins: {
+                            legend: { display: true },
+                        },
+                        scales: {
+                            y: {
+                                beginAtZero: true,
+                                ticks: { precision: 0 },
+                                title: { display: true, text: "Число случаев" }
+                            },
+                            y1: {
+                                position: "right",
+                                beginAtZero: true,
+                                min: 0,
+                                max: 110,
+                                ticks: {
+                                    callback: (value) => value + "%"
+                                },
+                                grid: { drawOnChartArea: false },
+                                title: { display: true, text: "% от максимума" }
+                            }
+                        }
+                    }
+                });
             }
 
             function renderDetailsAndChart() {
                 const d = currentDisease;
-                const container = document.getElementById("details");
-                const chartCanvas = document.getElementById("statsChart");
+                const container = els.details;
+                const chartCanvas = els.chart;
 
                 if (!d) return;
 
-                const yearFiltered = currentYear
-                    ? d.statistics.filter(s => s.year === currentYear)
-                    : d.statistics;
-
-                const seasonOrder = { "Зима": 0, "Весна": 1, "Лето": 2, "Осень": 3 };
-                const statsSorted = [...yearFiltered].sort((a, b) => {
-                    const sa = seasonOrder[a.season] ?? 0;
-                    const sb = seasonOrder[b.season] ?? 0;
-                    return sa - sb;
-                });
+                const statsSorted = d._statsByYear.get(currentYear) || [];
 
                 const symptoms = d.symptoms
                     .map(s => "<span class='pill'>" + s.name + "</span>")
@@ -1566,107 +2377,155 @@ def index():
                     container.classList.add("active");
                 });
 
-                if (statsSorted && statsSorted.length) {
-                    const labels = statsSorted.map(s => s.season);
-                    const values = statsSorted.map(s => s.cases);
-                    const maxVal = Math.max(...values);
-                    const percents = values.map(v => Math.round(v / maxVal * 100));
-
-                    chartCanvas.style.display = "block";
+                const hasStats = statsSorted.length > 0;
+                chartCanvas.style.display = hasStats ? "block" : "none";
+                chartCanvas.classList.remove("visible");
 
-                    if (statsChart) {
-                        statsChart.destroy();
-                    }
+                // Chart.js читает размеры canvas — обновление графика идёт после всех записей в DOM
+                if (hasStats) frameBatch.add(MEASURE, () => updateStatsChart(statsSorted));
+            }
 
-                    const ctx = chartCanvas.getContext("2d");
-                    statsChart = new Chart(ctx, {
-                        type: "bar",
-                        data: {
-                            labels: labels,
-                            datasets: [
-                                {
-                                    type: "bar",
-                                    label: "Число случаев",
-                                    data: values,
-                                    borderWidth: 1,
-                                    yAxisID: "y",
-                                },
-                                {
-                                    type: "line",
-                                    label: "Доля от максимума, %",
-                                    data: percents,
-                                    borderWidth: 2,
-                                    fill: false,
-                                    yAxisID: "y1",
-                                }
-                            ]
-                        },
-                        options: {
-                            interaction: { mode: "index", intersect: false },
-                            animation: {
-                                duration: 700,
-                                easing: "easeOutQuart"
-                            },
-                            plugins: {
-                                legend: { display: true },
-                            },
-                            scales: {
-                                y: {
-                                    beginAtZero: true,
-                                    ticks: { precision: 0 },
-                                    title: { display: true, text: "Число случаев" }
-                                },
-                                y1: {
-                                    position: "right",
-                                    beginAtZero: true,
-                                    min: 0,
-                                    max: 110,
-                                    ticks: {
-                                        callback: (value) => value + "%"
-                                    },
-                                    grid: { drawOnChartArea: false },
-                                    title: { display: true, text: "% от максимума" }
-                                }
-                            }
-                        }
+            // Промис выполняется, когда элемент размещён на странице и попадает в видимую область
+            function whenVisible(el) {
+                return new Promise(resolve => {
+                    const observer = new IntersectionObserver(entries => {
+                        if (!entries.some(entry => entry.isIntersecting)) return;
+                        observer.disconnect();
+                        resolve();
                     });
+                    observer.observe(el);
+                });
+            }
 
-                    chartCanvas.classList.remove("visible");
-                    requestAnimationFrame(() => {
-                        chartCanvas.classList.add("visible");
-                    });
-                } else {
-                    chartCanvas.style.display = "none";
-                    chartCanvas.classList.remove("visible");
-                    if (statsChart) { statsChart.destroy(); statsChart = null; }
+            // График создаётся один раз, когда загружена библиотека и canvas уже виден:
+            // Chart.js сразу получает настоящие размеры. Пока он создаётся, запоминаются
+            // только последние данные, и панель подробностей заново не отрисовывается.
+            let chartPending = null;
+            let pendingStats = null;
+
+            function updateStatsChart(statsSorted) {
+                if (statsChart) {
+                    applyStatsToChart(statsSorted);
+                    return;
                 }
+                pendingStats = statsSorted;
+                if (chartPending) return;
+
+                const canvas = els.chart;
+                chartPending = Promise.all([loadChartLib(), whenVisible(canvas)])
+                    .then(() => {
+                        statsChart = createStatsChart(canvas);
+                        applyStatsToChart(pendingStats);
+                    })
+                    .catch(e => console.error("Ошибка загрузки Chart.js", e))
+                    .finally(() => {
+                        chartPending = null;
+                        pendingStats = null;
+                    });
+            }
+
+            function applyStatsToChart(statsSorted) {
+                const chartCanvas = els.chart;
+                const labels = statsSorted.map(s => s.season);
+                const values = statsSorted.map(s => s.cases);
+                // максимум и проценты считаются без spread-аргументов и с одним делением
+                let maxVal = 0;
+                for (const v of values) if (v > maxVal) maxVal = v;
+                const inv = maxVal ? 100 / maxVal : 0;
+                const percents = new Array(values.length);
+                for (let i = 0; i < values.length; i++) percents[i] = Math.round(values[i] * inv);
+
+                statsChart.data.labels = labels;
+                statsChart.data.datasets[0].data = values;
+                statsChart.data.datasets[1].data = percents;
+                // обновление с анимацией, заданной в createStatsChart, как при создании графика
+                statsChart.update();
+
+                // класс добавляется в следующем кадре, чтобы сработала анимация появления
+                requestAnimationFrame(() => chartCanvas.classList.add("visible"));
             }
 
             // ---------------- Сброс ----------------
 
             function resetFilters() {
-                document.getElementById("search").value = "";
-                document.getElementById("ageGroup").value = "";
-                document.getElementById("transmission").value = "";
-                document.getElementById("symptomFilter").value = "";
+                els.search.value = "";
+                els.ageGroup.value = "";
+                els.transmission.value = "";
+                els.symptomFilter.value = "";
                 selectedId = null;
-                loadDiseases();
+                // все четыре сброса дают один запрос и одну перерисовку
+                queueLoadDiseases();
             }
 
             // ---------------- Инициализация ----------------
 
-            document.getElementById("th-id").addEventListener("click", () => setSort("id"));
-            document.getElementById("th-name").addEventListener("click", () => setSort("name"));
+            // один обработчик на заголовок таблицы для всех сортируемых колонок
+            els.thead.addEventListener("click", e => {
+                const th = e.target.closest("th[data-sort]");
+                if (th) setSort(th.dataset.sort);
+            });
+
+            // обработчик прокрутки не вызывает preventDefault — браузеру не нужно его ждать
+            els.tableScroll.addEventListener("scroll", onTableScroll, { passive: true });
+
+            // экземпляр графика живёт всё время работы страницы и уничтожается только при выгрузке;
+            // страница, сохранённая в кэше истории (persisted), остаётся с графиком
+            window.addEventListener("pagehide", e => {
+                if (e.persisted || !statsChart) return;
+                statsChart.destroy();
+                statsChart = null;
+            });
+
+            els.tbody.addEventListener("mouseover", onTableHover);
+            els.tbody.addEventListener("mouseleave", () => {
+                hoveredRow = null;
+                clearTimeout(prefetchTimer);
+            });
+
+            // один обработчик кликов на всю таблицу вместо обработчика на каждой строке
+            els.tbody.addEventListener("click", e => {
+                const tr = e.target.closest("tr[data-id]");
+                if (tr) onRowClick(tr);
+            });
+
             updateSortHeaderStyles();
 
             initTheme();
-            loadFilters().then(loadDiseases);
+            loadFilters().then(queueLoadDiseases);
         </script>
     </body>
-    </html>s
-    """
+    </html>
+    """.encode("utf-8")
+
+# Страница сжимается один раз при импорте, вариант выбирается по Accept-Encoding
+INDEX_VARIANTS = precompress(INDEX_HTML)
+
+
+@app.get("/", response_class=HTMLResponse)
+async def index(request: Request) -> Response:
+    # страница перепроверяется при каждом открытии (no-cache), но без изменений не передаётся
+    return negotiated_response(request, INDEX_VARIANTS, "text/html", "no-cache")
 
 
 if __name__ == "__main__":
+    import os
+
     import uvicorn
-    uvicorn.run("VKR:app", host="127.0.0.1", port=8001, reload=True)
\ No newline at end of file
+
+    if os.getenv("DEV"):
+        # режим разработки: один процесс с перезапуском при изменении файлов
+        uvicorn.run("VKR:app", host="127.0.0.1", port=8001, reload=True)
+    else:
+        # рабочий режим: процесс на каждое ядро, без журнала запросов;
+        # loop/http="auto" выбирают uvloop и httptools, если они установлены
+        # (uvloop недоступен под Windows, тогда используется стандартный asyncio)
+        uvicorn.run(
+            "VKR:app",
+            host="0.0.0.0",
+            port=8001,
+            workers=os.cpu_count() or 1,
+            loop="auto",
+            http="auto",
+            log_level="warning",
+            access_log=False,
+        )